@@ -1,4 +1,4 @@
-from pathlib import Path
+import os
 
 def create_project_structure():
     """Create the MTS project directory structure."""
@@ -32,18 +32,21 @@ def create_project_structure():
         "tests/services": ["__init__.py"],
     }
     
-    # Create directories
-    for dir_path in base_dirs:
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
+    # Create each directory once, covering both lists
+    for dir_path in sorted({*base_dirs, *python_files}):
+        os.makedirs(dir_path, exist_ok=True)
     
-    # Create Python files
-    for dir_path, files in python_files.items():
-        for file_name in files:
-            file_path = Path(dir_path) / file_name
-            file_path.touch(exist_ok=True)
-            
-    # Create main application file
-    Path("src/mts/main.py").touch(exist_ok=True)
+    # Create Python files (plus the main application file) without the
+    # extra stat/utime calls that Path.touch() makes on existing files
+    file_paths = [
+        os.path.join(dir_path, file_name)
+        for dir_path, files in python_files.items()
+        for file_name in files
+    ]
+    file_paths.append("src/mts/main.py")
+    for file_path in file_paths:
+        fd = os.open(file_path, os.O_CREAT | os.O_WRONLY | getattr(os, "O_NOCTTY", 0), 0o644)
+        os.close(fd)
     
     print("Project structure created successfully!")
 
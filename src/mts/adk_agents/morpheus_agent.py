@@ -1,17 +1,24 @@
+import functools
+import sys
+from typing import Final
 import adk
 from ..core.config import ModelConfig
 from ..adk_tools.trading_tools import TradingTools
 from ..adk_tools.risk_tools import RiskTools
 
+_PROMPT: Final[str] = sys.intern("""You are Morpheus, a strict risk management officer. Given a trading signal and current portfolio state, your role is to assess the risk. Calculate the appropriate position size and determine if the trade adheres to the portfolio's risk parameters. Your output must be a JSON object containing 'risk_assessment', 'position_size', and 'decision' (GO/NO-GO) keys.""")
+
+@functools.lru_cache(maxsize=4)
+def _build_agent(model_name: str, risk_tools: RiskTools, trading_tools: TradingTools) -> adk.Agent:
+    """Build the Morpheus agent once per (model, tools) combination."""
+    return adk.Agent(
+        model=model_name,
+        instruction_prompt=_PROMPT,
+        tools=[risk_tools, trading_tools]
+    )
+
 def create_morpheus_agent(risk_tools: RiskTools, trading_tools: TradingTools, config: ModelConfig) -> adk.Agent:
     """
     Creates an ADK Agent for Morpheus, specializing in risk management.
     """
-    return adk.Agent(
-        model=config.formatted_name,
-        instruction_prompt="""You are Morpheus, a strict risk management officer. Given a trading signal and current portfolio state, your role is to assess the risk. Calculate the appropriate position size and determine if the trade adheres to the portfolio's risk parameters. Your output must be a JSON object containing 'risk_assessment', 'position_size', and 'decision' (GO/NO-GO) keys.""",
-        tools=[
-            risk_tools,
-            trading_tools
-        ]
-    )
+    return _build_agent(config.formatted_name, risk_tools, trading_tools)
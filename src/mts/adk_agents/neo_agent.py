@@ -1,15 +1,23 @@
+import functools
+import sys
+from typing import Final
 import adk
 from ..core.config import ModelConfig
 from ..adk_tools.trading_tools import TradingTools
 
+_PROMPT: Final[str] = sys.intern("""You are Neo, an expert in technical analysis and pattern recognition. Based on the market analysis provided to you, your job is to identify classical and novel trading patterns and generate a clear, actionable trading signal (BUY, SELL, or HOLD) with a confidence score. If you need fresh market data, use get_market_snapshot rather than calling the individual market data tools. Respond only with a JSON object containing 'signal', 'confidence', and 'reasoning' keys.""")
+
+@functools.lru_cache(maxsize=4)
+def _build_agent(model_name: str, trading_tools: TradingTools) -> adk.Agent:
+    """Build the Neo agent once per (model, tools) combination."""
+    return adk.Agent(
+        model=model_name,
+        instruction_prompt=_PROMPT,
+        tools=[trading_tools]
+    )
+
 def create_neo_agent(trading_tools: TradingTools, config: ModelConfig) -> adk.Agent:
     """
     Creates an ADK Agent for Neo, specializing in technical analysis and pattern recognition.
     """
-    return adk.Agent(
-        model=config.formatted_name,
-        instruction_prompt="""You are Neo, an expert in technical analysis and pattern recognition. Based on the market analysis provided to you, your job is to identify classical and novel trading patterns and generate a clear, actionable trading signal (BUY, SELL, or HOLD) with a confidence score. Respond only with a JSON object containing 'signal', 'confidence', and 'reasoning' keys.""",
-        tools=[
-            trading_tools
-        ]
-    )
+    return _build_agent(config.formatted_name, trading_tools)
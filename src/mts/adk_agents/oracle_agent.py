@@ -1,15 +1,23 @@
+import functools
+import sys
+from typing import Final
 import adk
 from ..core.config import ModelConfig
 from ..adk_tools.trading_tools import TradingTools
 
+_PROMPT: Final[str] = sys.intern("""You are the Oracle, a quantitative financial analyst. Your sole purpose is to analyze market data using the provided tools (prefer get_market_snapshot, which returns market info, order book, recent trades and funding rate in one call) to generate price predictions and a comprehensive market summary. Respond only with a JSON object containing 'prediction', 'summary', and 'confidence' keys.""")
+
+@functools.lru_cache(maxsize=4)
+def _build_agent(model_name: str, trading_tools: TradingTools) -> adk.Agent:
+    """Build the Oracle agent once per (model, tools) combination."""
+    return adk.Agent(
+        model=model_name,
+        instruction_prompt=_PROMPT,
+        tools=[trading_tools]
+    )
+
 def create_oracle_agent(trading_tools: TradingTools, config: ModelConfig) -> adk.Agent:
     """
     Creates an ADK Agent for the Oracle, specializing in market analysis.
     """
-    return adk.Agent(
-        model=config.formatted_name,
-        instruction_prompt="""You are the Oracle, a quantitative financial analyst. Your sole purpose is to analyze market data using the provided tools to generate price predictions and a comprehensive market summary. Respond only with a JSON object containing 'prediction', 'summary', and 'confidence' keys.""",
-        tools=[
-            trading_tools
-        ]
-    )
+    return _build_agent(config.formatted_name, trading_tools)
@@ -1,15 +1,23 @@
+import functools
+import sys
+from typing import Final
 import adk
 from ..core.config import ModelConfig
 from ..adk_tools.trading_tools import TradingTools
 
+_PROMPT: Final[str] = sys.intern("""You are Trinity, a trade execution specialist. Your only function is to take a fully approved trading order and execute it using the available tools. When the plan involves more than one order, submit them together with execute_orders instead of calling execute_order repeatedly. You will then monitor the order's status and report back on the execution details. Respond only with a JSON object containing 'status', 'order_id', and 'details' keys.""")
+
+@functools.lru_cache(maxsize=4)
+def _build_agent(model_name: str, trading_tools: TradingTools) -> adk.Agent:
+    """Build the Trinity agent once per (model, tools) combination."""
+    return adk.Agent(
+        model=model_name,
+        instruction_prompt=_PROMPT,
+        tools=[trading_tools]
+    )
+
 def create_trinity_agent(trading_tools: TradingTools, config: ModelConfig) -> adk.Agent:
     """
     Creates an ADK Agent for Trinity, specializing in trade execution.
     """
-    return adk.Agent(
-        model=config.formatted_name,
-        instruction_prompt="""You are Trinity, a trade execution specialist. Your only function is to take a fully approved trading order and execute it using the available tools. You will then monitor the order's status and report back on the execution details. Respond only with a JSON object containing 'status', 'order_id', and 'details' keys.""",
-        tools=[
-            trading_tools
-        ]
-    )
+    return _build_agent(config.formatted_name, trading_tools)
@@ -20,14 +20,10 @@ class RiskTools(adk.Tool):
         Returns:
             The calculated position size in units of the asset.
         """
-        try:
-            if price <= 0 or total_equity <= 0 or risk_percentage <= 0:
-                logger.warning("Invalid input for position size calculation. Price, total_equity, and risk_percentage must be positive.")
-                return 0.0
-
-            max_position_value = total_equity * risk_percentage
-            position_size = max_position_value / price
-            return position_size
-        except Exception as e:
-            logger.error(f"Error calculating position size for {asset}: {e}")
+        valid = price > 0 and total_equity > 0 and risk_percentage > 0
+        if not valid:
+            logger.warning(f"Invalid input for position size calculation for {asset}. Price, total_equity, and risk_percentage must be positive.")
             return 0.0
+
+        # Division by a verified-positive price cannot raise
+        return total_equity * risk_percentage / price
@@ -1,16 +1,37 @@
 import asyncio
+import functools
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from loguru import logger
+from pydantic import SecretStr
 
 from google_adk import Tool, tool_method
 
 from ..core.config import MTSConfig
-from ..models.execution import OrderRequest, OrderResult, OrderStatus
+from ..models.execution import OrderRequest, OrderResult, OrderSide, OrderStatus, OrderType
 from ..models.market import OrderBook, Trade, FundingRate
 from mts.services.hyperliquid import HyperliquidService
 from ..services.paper_trading import PaperTradingService
 
+# Services shared by every TradingTools instance for the same Hyperliquid connection,
+# keyed by (account address, testnet flag, secret key), along with the task that
+# initializes each shared HyperliquidService. A failed or cancelled init task is
+# dropped, so the next tool call retries.
+_ServiceKey = Tuple[str, bool, SecretStr]
+_HL_CACHE: Dict[_ServiceKey, HyperliquidService] = {}
+_PT_CACHE: Dict[_ServiceKey, PaperTradingService] = {}
+_INIT_CACHE: Dict[_ServiceKey, asyncio.Task] = {}
+
+def _start_init(key: _ServiceKey, loop: asyncio.AbstractEventLoop) -> asyncio.Task:
+    task = _INIT_CACHE[key] = loop.create_task(_HL_CACHE[key].initialize())
+    task.add_done_callback(functools.partial(_forget_failed_init, key))
+    return task
+
+def _forget_failed_init(key: _ServiceKey, task: asyncio.Task) -> None:
+    # Also marks the exception as retrieved when no tool call was awaiting the task
+    if (task.cancelled() or task.exception() is not None) and _INIT_CACHE.get(key) is task:
+        del _INIT_CACHE[key]
+
 class TradingTools(adk.Tool):
     """
     A collection of tools for interacting with trading services, including market data
@@ -18,11 +39,36 @@ class TradingTools(adk.Tool):
     """
     def __init__(self, config: MTSConfig):
         self.config = config
-        self.hyperliquid_service = HyperliquidService(config)
-        self.paper_trading_service = PaperTradingService(self.hyperliquid_service)
+        hl = config.hyperliquid
+        self._service_key: _ServiceKey = (hl.account_address, hl.is_testnet, hl.secret_key)
+        key = self._service_key
+        if key not in _HL_CACHE:
+            _HL_CACHE[key] = HyperliquidService(config)
+            _PT_CACHE[key] = PaperTradingService(_HL_CACHE[key])
+        self.hyperliquid_service = _HL_CACHE[key]
+        self.paper_trading_service = _PT_CACHE[key]
         
-        # Initialize HyperliquidService asynchronously
-        asyncio.create_task(self.hyperliquid_service.initialize())
+        # Start initializing HyperliquidService if a loop is already running; otherwise
+        # (sync startup, tests) the first tool call starts it via _ensure_init
+        if key not in _INIT_CACHE:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                _start_init(key, loop)
+
+    async def _ensure_init(self) -> None:
+        """Initialize the shared HyperliquidService once, surfacing any init error to the caller."""
+        init = _INIT_CACHE.get(self._service_key)
+        if init is not None and init.done() and not init.cancelled() and init.exception() is None:
+            return
+        loop = asyncio.get_running_loop()
+        if init is None or init.done() or init.get_loop() is not loop:
+            # First call, a failed attempt, or a task pending on another (e.g. closed) loop
+            init = _start_init(self._service_key, loop)
+        # Shielded so a cancelled tool call doesn't cancel the init shared with other callers
+        await asyncio.shield(init)
 
     @adk.tool_method
     async def get_market_info(self, asset: str) -> Dict[str, Any]:
@@ -36,6 +82,7 @@ class TradingTools(adk.Tool):
             A dictionary containing market data such as mark price, index price,
             open interest, 24h volume, funding rate, and last update timestamp.
         """
+        await self._ensure_init()
         return await self.hyperliquid_service.get_market_info(asset)
 
     @adk.tool_method
@@ -49,6 +96,7 @@ class TradingTools(adk.Tool):
         Returns:
             An OrderBook object containing lists of bids and asks with their prices and quantities.
         """
+        await self._ensure_init()
         return await self.hyperliquid_service.get_order_book(asset)
 
     @adk.tool_method
@@ -63,6 +111,7 @@ class TradingTools(adk.Tool):
         Returns:
             A list of Trade objects, each representing a recent trade.
         """
+        await self._ensure_init()
         return await self.hyperliquid_service.get_recent_trades(asset, limit)
 
     @adk.tool_method
@@ -76,8 +125,37 @@ class TradingTools(adk.Tool):
         Returns:
             A FundingRate object containing the asset, timestamp, and the funding rate.
         """
+        await self._ensure_init()
         return await self.hyperliquid_service.get_funding_rate(asset)
 
+    @adk.tool_method
+    async def get_market_snapshot(self, asset: str, trades_limit: int = 100) -> Dict[str, Any]:
+        """
+        Retrieves market info, order book, recent trades and funding rate for an asset
+        in a single call, fetching all four concurrently.
+
+        Args:
+            asset: The symbol of the asset.
+            trades_limit: The maximum number of recent trades to retrieve (default is 100).
+
+        Returns:
+            A dictionary with 'market_info', 'order_book', 'trades' and 'funding' keys,
+            holding the same values as the individual market data tools.
+        """
+        await self._ensure_init()
+        market_info, order_book, trades, funding = await asyncio.gather(
+            self.hyperliquid_service.get_market_info(asset),
+            self.hyperliquid_service.get_order_book(asset),
+            self.hyperliquid_service.get_recent_trades(asset, trades_limit),
+            self.hyperliquid_service.get_funding_rate(asset)
+        )
+        return {
+            "market_info": market_info,
+            "order_book": order_book,
+            "trades": trades,
+            "funding": funding
+        }
+
     @adk.tool_method
     async def execute_order(self, order_request: Dict[str, Any]) -> OrderResult:
         """
@@ -92,17 +170,72 @@ class TradingTools(adk.Tool):
             An OrderResult object detailing the outcome of the order execution.
         """
         try:
+            await self._ensure_init()
             # Convert dictionary to OrderRequest Pydantic model
             order = OrderRequest(**order_request)
             return await self.paper_trading_service.execute_order(order)
         except Exception as e:
             logger.error(f"Failed to execute order: {e}")
-            return OrderResult(
-                request=OrderRequest(asset="", side="buy", order_type="market", quantity=0),
-                order_id="",
-                status=OrderStatus.REJECTED,
-                error_message=str(e)
+            return self._rejected_result(e)
+
+    @adk.tool_method
+    async def execute_orders(self, order_requests: List[Dict[str, Any]]) -> List[OrderResult]:
+        """
+        Executes several trading orders in one batch. Prefer this over repeated
+        execute_order calls when a plan involves more than one order.
+
+        Args:
+            order_requests: A list of order dictionaries, each with the same keys as
+                            accepted by execute_order.
+
+        Returns:
+            A list of OrderResult objects in the same order as the requests. Requests that
+            fail validation or execution are returned with a REJECTED status.
+        """
+        try:
+            await self._ensure_init()
+        except Exception as e:
+            # Nothing was sent, so every request is rejected with the init error
+            logger.error(f"Failed to execute order batch: {e}")
+            return [self._rejected_result(e) for _ in order_requests]
+        results: List[Optional[OrderResult]] = [None] * len(order_requests)
+        orders: List[OrderRequest] = []
+        positions: List[int] = []
+        for i, request in enumerate(order_requests):
+            try:
+                orders.append(OrderRequest(**request))
+                positions.append(i)
+            except Exception as e:
+                logger.error(f"Failed to execute order: {e}")
+                results[i] = self._rejected_result(e)
+
+        if orders:
+            # The batch reports each order's outcome separately, so an order that fails
+            # partway through never masks the fills that came before it
+            executed = await self.paper_trading_service.execute_orders_batch(orders)
+            for i, order, result in zip(positions, orders, executed):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to execute order: {result}")
+                    result = self._rejected_result(result, order)
+                results[i] = result
+
+        return results
+
+    @staticmethod
+    def _rejected_result(error: Exception, request: Optional[OrderRequest] = None) -> OrderResult:
+        """Build the REJECTED result returned when an order cannot be executed."""
+        if request is None:
+            # Placeholder for requests that failed validation; model_construct skips
+            # validation (quantity=0 would fail gt=0)
+            request = OrderRequest.model_construct(
+                asset="", side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=0
             )
+        return OrderResult(
+            request=request,
+            order_id="",
+            status=OrderStatus.REJECTED,
+            error_message=str(error)
+        )
 
     @adk.tool_method
     async def get_position(self, asset: str) -> Optional[Dict[str, Any]]:
@@ -116,6 +249,7 @@ class TradingTools(adk.Tool):
             A dictionary representing the current position (size, entry price, PnL, etc.),
             or None if no position exists for the asset.
         """
+        await self._ensure_init()
         return await self.paper_trading_service.get_position(asset)
 
     @adk.tool_method
@@ -129,4 +263,5 @@ class TradingTools(adk.Tool):
         Returns:
             An OrderResult object containing the current status of the order.
         """
+        await self._ensure_init()
         return await self.paper_trading_service.get_order_status(order_id)
@@ -1,14 +1,55 @@
 """Main configuration for MTS"""
 import os
-from typing import Dict, List, Optional, Literal
+import sys
+from functools import cached_property
+from typing import Dict, List, Optional, Literal, Tuple
 from pydantic import BaseModel, Field, SecretStr, ConfigDict, field_validator
+from dotenv import load_dotenv
 from loguru import logger
 HL_TESTNET_API_URL = "https://api.hyperliquid.xyz/" # Default testnet API URL
 HL_MAINNET_API_URL = "https://api.hyperliquid.xyz/" # Default mainnet API URL
 
+# Whether .env has already been read into os.environ for this process
+_DOTENV_LOADED = False
+
+# Environment variables read by MTSConfig.from_env; the last config built is reused
+# while all of them keep the same values
+_ENV_KEYS = (
+    "ANTHROPIC_API_KEY",
+    "GOOGLE_API_KEY",
+    "HL_ANTHROPIC_MODEL_NAME",
+    "HL_GOOGLE_MODEL_NAME",
+    "HL_ACCOUNT_ADDRESS",
+    "HL_SECRET_KEY",
+    "HL_TESTNET",
+    "HL_BASE_POSITION",
+    "HL_MAX_POSITION",
+    "HL_LEVERAGE",
+    "HL_MODEL_TEMPERATURE",
+    "HL_MODEL_MAX_TOKENS",
+    "HL_MODEL_TOP_P",
+    "AGENT_SYSTEM_PROMPT",
+    "DEBUG_MODE"
+)
+_config_cache: Optional[Tuple[Tuple[Optional[str], ...], 'MTSConfig']] = None
+
+# Supported model names, checked by ModelConfig.validate_model_name
+_VALID_PREFIXES = ("openai:", "google:", "anthropic:")
+_ANTHROPIC_MODELS = frozenset({
+    "claude-3-5-sonnet-latest",
+    "claude-3-haiku",
+    "claude-3-opus",
+    "claude-2.1"
+})
+_GOOGLE_MODELS = frozenset({
+    "gemini-1.5-flash-latest",
+    "gemini-1.5-pro-latest",
+    "gemini-pro"
+})
+
 class ModelConfig(BaseModel):
     """Model-specific configuration"""
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, ignored_types=(cached_property,))
     
     provider: Literal["anthropic", "google"] = Field(
         "anthropic",
@@ -26,43 +67,28 @@ class ModelConfig(BaseModel):
     max_tokens: int = Field(4096, description="Maximum tokens per request")
     top_p: float = Field(0.9, description="Top p sampling parameter")
 
-    @property
+    @cached_property
     def formatted_name(self) -> str:
-        """Get properly formatted model name for PydanticAI"""
-        # Return the full model name with provider prefix
+        """Get properly formatted model name for PydanticAI (computed once per instance)"""
+        # Return the full model name with provider prefix, interned so every agent
+        # built from this config shares the same string object
         if ':' not in self.model_name:
-            return f"{self.provider}:{self.model_name}"
-        return self.model_name
+            return sys.intern(f"{self.provider}:{self.model_name}")
+        return sys.intern(self.model_name)
 
     @field_validator('model_name')
     def validate_model_name(cls, v, values):
         """Validate model name is supported"""
-        valid_prefixes = ['openai:', 'google:', 'anthropic:']
-        if not any(v.startswith(prefix) for prefix in valid_prefixes):
-            raise ValueError(f"Model name must start with one of {valid_prefixes}")
-        
-        # Additional validation for Anthropic models
-        if values.get('provider') == 'anthropic':
-            valid_models = [
-                "claude-3-5-sonnet-latest",
-                "claude-3-haiku",
-                "claude-3-opus",
-                "claude-2.1"
-            ]
-            _, model = v.split(':', 1)
-            if model not in valid_models:
-                raise ValueError(f"Invalid Anthropic model. Must be one of: {valid_models}")
+        prefix, sep, model = v.partition(':')
+        if not sep or prefix + sep not in _VALID_PREFIXES:
+            raise ValueError(f"Model name must start with one of {list(_VALID_PREFIXES)}")
         
-        # Additional validation for Google models
-        if values.get('provider') == 'google':
-            valid_models = [
-                "gemini-1.5-flash-latest",
-                "gemini-1.5-pro-latest",
-                "gemini-pro"
-            ]
-            _, model = v.split(':', 1)
-            if model not in valid_models:
-                raise ValueError(f"Invalid Google model. Must be one of: {valid_models}")
+        # Additional validation for provider-specific models
+        provider = values.data.get('provider')
+        if provider == 'anthropic' and model not in _ANTHROPIC_MODELS:
+            raise ValueError(f"Invalid Anthropic model. Must be one of: {sorted(_ANTHROPIC_MODELS)}")
+        if provider == 'google' and model not in _GOOGLE_MODELS:
+            raise ValueError(f"Invalid Google model. Must be one of: {sorted(_GOOGLE_MODELS)}")
         return v
 
 class HyperliquidConfig(BaseModel):
@@ -122,37 +148,47 @@ class MTSConfig(BaseModel):
     @classmethod
     def from_env(cls) -> 'MTSConfig':
         """Create configuration from environment variables"""
-        from dotenv import load_dotenv
+        global _DOTENV_LOADED, _config_cache
+        if not _DOTENV_LOADED:
+            load_dotenv()
+            _DOTENV_LOADED = True
         
-        load_dotenv()
+        # Snapshot the environment once instead of querying os.environ per key
+        env = dict(os.environ)
         
-        # Print environment variables for debugging (excluding sensitive data)
-        env_vars = {k: v for k, v in os.environ.items() 
-                if k.startswith(('HL_', 'DEBUG_')) and 'KEY' not in k}
-        logger.debug(f"Environment variables: {env_vars}")
+        # Skip re-validation when none of the relevant variables changed
+        env_key = tuple(env.get(k) for k in _ENV_KEYS)
+        if _config_cache is not None and _config_cache[0] == env_key:
+            return _config_cache[1]
+        
+        # Print environment variables for debugging (excluding sensitive data);
+        # the dict is only built when a DEBUG sink is active
+        logger.opt(lazy=True).debug(
+            "Environment variables: {}",
+            lambda: {k: v for k, v in env.items()
+                     if k.startswith(('HL_', 'DEBUG_')) and 'KEY' not in k}
+        )
         
         # Validate required environment variables
-        anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
-        google_api_key = os.getenv("GOOGLE_API_KEY")
+        anthropic_api_key = env.get("ANTHROPIC_API_KEY")
+        google_api_key = env.get("GOOGLE_API_KEY")
 
         if not anthropic_api_key and not google_api_key:
             raise ValueError("Either ANTHROPIC_API_KEY or GOOGLE_API_KEY must be set.")
 
+        # Anthropic takes precedence when both keys are present
+        api_key = SecretStr(anthropic_api_key or google_api_key)
         if anthropic_api_key:
             model_provider = "anthropic"
-            model_name = os.getenv("HL_ANTHROPIC_MODEL_NAME", "anthropic:claude-3-5-sonnet-latest")
-            api_key = SecretStr(anthropic_api_key)
-        elif google_api_key:
-            model_provider = "google"
-            model_name = os.getenv("HL_GOOGLE_MODEL_NAME", "google:gemini-1.5-flash-latest")
-            api_key = SecretStr(google_api_key)
+            model_name = env.get("HL_ANTHROPIC_MODEL_NAME", "anthropic:claude-3-5-sonnet-latest")
         else:
-            raise ValueError("No valid AI model API key found.")
+            model_provider = "google"
+            model_name = env.get("HL_GOOGLE_MODEL_NAME", "google:gemini-1.5-flash-latest")
 
         # Validate required environment variables for Hyperliquid
         required_hl_vars = {
-            "HL_ACCOUNT_ADDRESS": os.getenv("HL_ACCOUNT_ADDRESS"),
-            "HL_SECRET_KEY": os.getenv("HL_SECRET_KEY")
+            "HL_ACCOUNT_ADDRESS": env.get("HL_ACCOUNT_ADDRESS"),
+            "HL_SECRET_KEY": env.get("HL_SECRET_KEY")
         }
         
         missing_hl_vars = [k for k, v in required_hl_vars.items() if not v]
@@ -166,31 +202,37 @@ class MTSConfig(BaseModel):
             provider=model_provider,
             model_name=model_name,
             api_key=api_key,
-            temperature=float(os.getenv("HL_MODEL_TEMPERATURE", "0.7")),
-            max_tokens=int(os.getenv("HL_MODEL_MAX_TOKENS", "4096")),
-            top_p=float(os.getenv("HL_MODEL_TOP_P", "0.9"))
+            temperature=float(env.get("HL_MODEL_TEMPERATURE", "0.7")),
+            max_tokens=int(env.get("HL_MODEL_MAX_TOKENS", "4096")),
+            top_p=float(env.get("HL_MODEL_TOP_P", "0.9"))
         )
         
         config = cls(
             hyperliquid=HyperliquidConfig(
-                account_address=os.getenv("HL_ACCOUNT_ADDRESS"),
-                secret_key=SecretStr(os.getenv("HL_SECRET_KEY", "")),
-                is_testnet=os.getenv("HL_TESTNET", "true").lower() == "true",
-                base_position=float(os.getenv("HL_BASE_POSITION", "1.0")),
-                max_position=float(os.getenv("HL_MAX_POSITION", "5.0")),
-                leverage=int(os.getenv("HL_LEVERAGE", "3"))
+                account_address=env.get("HL_ACCOUNT_ADDRESS"),
+                secret_key=SecretStr(env.get("HL_SECRET_KEY", "")),
+                is_testnet=env.get("HL_TESTNET", "true").lower() == "true",
+                base_position=float(env.get("HL_BASE_POSITION", "1.0")),
+                max_position=float(env.get("HL_MAX_POSITION", "5.0")),
+                leverage=int(env.get("HL_LEVERAGE", "3"))
             ),
             agent=AgentConfig(
                 model=model_config,
-                system_prompt=os.getenv(
+                system_prompt=env.get(
                     "AGENT_SYSTEM_PROMPT",
                     "You are MTS, an autonomous trading agent..."
                 )
             ),
-            debug_mode=os.getenv("DEBUG_MODE", "false").lower() == "true"
+            debug_mode=env.get("DEBUG_MODE", "false").lower() == "true"
         )
         
         # Log successful config creation (excluding sensitive data)
-        logger.debug(f"Created config: {config.model_dump(exclude={'hyperliquid.secret_key', 'agent.model.api_key'})}")
+        logger.opt(lazy=True).debug(
+            "Created config: {}",
+            lambda: config.model_dump_json(
+                exclude={'hyperliquid': {'secret_key'}, 'agent': {'model': {'api_key'}}}
+            )
+        )
         
+        _config_cache = (env_key, config)
         return config
\ No newline at end of file
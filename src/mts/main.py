@@ -1,14 +1,16 @@
 import asyncio
 import os
+import sys
 from loguru import logger
-from dotenv import load_dotenv
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default asyncio event loop
+    uvloop = None
 
 from mts.core.config import MTSConfig
 from mts.orchestrator import MTSOrchestrator
 
-# Load environment variables first
-load_dotenv()
-
 # Configure logging
 logger.remove()  # Remove default handler
 logger.add(
@@ -18,19 +20,27 @@ logger.add(
     level="DEBUG",  # Full logging in file
     format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}"
 )
-# Add console output
+# Add console output, hiding the noisy per-cycle progress messages
+_NOISY_MESSAGES = (
+    "Starting market data update",
+    "Got orderbook",
+    "Got recent trades",
+    "Got funding rate",
+    "Calculated metrics",
+    "Starting pattern analysis",
+    "Starting risk monitoring",
+    "Starting order management cycle"
+)
+
+def _console_filter(record) -> bool:
+    """Drop console records whose message contains one of the noisy phrases"""
+    message = record["message"]
+    return not any(noisy in message for noisy in _NOISY_MESSAGES)
+
 logger.add(
-    lambda msg: print(msg) if not any(x in str(msg) for x in [
-        "Starting market data update",
-        "Got orderbook",
-        "Got recent trades",
-        "Got funding rate",
-        "Calculated metrics",
-        "Starting pattern analysis",
-        "Starting risk monitoring",
-        "Starting order management cycle"
-    ]) else None,
+    sys.stdout,
     level="INFO",
+    filter=_console_filter,
     format="<green>{time:HH:mm:ss}</green> | <level>{message}</level>"
 )
 
@@ -61,17 +71,16 @@ async def main():
 def run():
     """Entry point for running the system"""
     try:
-        # Create and run the event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(main())
+        # Run on uvloop when it is installed; both runners manage the loop lifecycle
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt - shutting down...")
     except Exception as e:
         logger.error(f"Fatal error during execution: {e}")
         raise
-    finally:
-        loop.close()
 
 if __name__ == "__main__":
     run()
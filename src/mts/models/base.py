@@ -1,7 +1,199 @@
 """Base models and enums for MTS system"""
+import sys
+from datetime import datetime, timezone
 from enum import Enum
+from typing import Annotated, Any, ClassVar, Dict, Tuple
+import numpy as np
+from pydantic import (
+    BaseModel, GetCoreSchemaHandler, GetJsonSchemaHandler, PlainSerializer, PlainValidator, PrivateAttr,
+    ValidatorFunctionWrapHandler, WithJsonSchema, computed_field, model_validator
+)
+from pydantic_core import core_schema
 
-class SystemRole(str, Enum):
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def to_epoch_ns(ts: datetime) -> int:
+    """Epoch nanoseconds for a datetime (naive values are taken as UTC)"""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    delta = ts - EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+def _array_type(dtype, item_type: str):
+    """Annotated ndarray field type: copied on validation, a list in JSON and its schema
+    
+    The copy keeps a model from sharing (and being changed through) the caller's buffer.
+    """
+    return Annotated[
+        np.ndarray,
+        PlainValidator(lambda v: np.array(v, dtype=dtype)),
+        PlainSerializer(lambda a: a.tolist(), return_type=list, when_used='json'),
+        WithJsonSchema({'type': 'array', 'items': {'type': item_type}}),
+    ]
+
+FloatArray = _array_type(np.float64, 'number')
+IntArray = _array_type(np.int64, 'integer')
+BoolArray = _array_type(np.bool_, 'boolean')
+_ARRAY_TYPES_BY_KIND = {'f': FloatArray, 'i': IntArray, 'b': BoolArray}
+
+def _values_equal(a: Any, b: Any) -> bool:
+    """Equality that compares NumPy arrays element-wise, including inside dicts and lists"""
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return isinstance(a, np.ndarray) and isinstance(b, np.ndarray) and np.array_equal(a, b)
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_values_equal(v, b[k]) for k, v in a.items())
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return type(a) is type(b) and len(a) == len(b) and all(map(_values_equal, a, b))
+    return a == b
+
+def _hashable(v: Any) -> Any:
+    return (v.dtype.str, v.shape, v.tobytes()) if isinstance(v, np.ndarray) else v
+
+class ArrayModel(BaseModel):
+    """BaseModel for models holding NumPy arrays in fields or private attributes
+    
+    The default pydantic __eq__ and frozen __hash__ fail on arrays; these compare
+    arrays element-wise and hash their contents. Array fields of frozen models are
+    made read-only, so the content hash and any cached values stay valid.
+    """
+    def model_post_init(self, __context: Any) -> None:
+        if self.model_config.get('frozen'):
+            for value in self._field_values().values():
+                if isinstance(value, np.ndarray):
+                    value.flags.writeable = False
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return (
+            type(self) is type(other)
+            and _values_equal(self._field_values(), other._field_values())
+            and _values_equal(self.__pydantic_private__, other.__pydantic_private__)
+            and _values_equal(self.__pydantic_extra__, other.__pydantic_extra__)
+        )
+    
+    def _field_values(self) -> dict:
+        # Only declared fields: cached properties also live in __dict__
+        return {name: self.__dict__.get(name) for name in type(self).model_fields}
+    
+    def _array_hash(self) -> int:
+        return hash((type(self), *(_hashable(v) for v in self._field_values().values())))
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__hash__ = cls._array_hash if cls.model_config.get('frozen') else None
+
+class ColumnBuffer(BaseModel):
+    """Rows stored column-wise in preallocated NumPy arrays, doubled when full
+    
+    Subclasses declare `_columns` (name -> dtype); each becomes a computed field
+    viewing the filled rows, so dumps carry the data, and validating the dumped
+    columns back rebuilds the buffers.
+    """
+    _columns: ClassVar[Dict[str, Any]] = {}
+    _initial_capacity: ClassVar[int] = 64
+    
+    _count: int = PrivateAttr(default=0)
+    _buffers: Dict[str, np.ndarray] = PrivateAttr(default_factory=dict)
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Runs before pydantic collects the class's decorators, so these are picked up as computed fields
+        for name, dtype in cls.__dict__.get('_columns', {}).items():
+            view = property(lambda self, name=name: self._buffers[name][:self._count])
+            setattr(cls, name, computed_field(view, return_type=_ARRAY_TYPES_BY_KIND[np.dtype(dtype).kind]))
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._buffers = {name: np.empty(self._initial_capacity, dtype=dtype) for name, dtype in self._columns.items()}
+    
+    @model_validator(mode='wrap')
+    def from_columns(cls, data: Any, handler: ValidatorFunctionWrapHandler) -> 'ColumnBuffer':
+        """Rebuild the buffers from serialized columns"""
+        columns = None
+        if isinstance(data, dict) and any(name in data for name in cls._columns):
+            data = dict(data)
+            columns = [np.asarray(data.pop(name, ())) for name in cls._columns]
+        buffer = handler(data)
+        if columns is not None:
+            buffer._load_columns(columns)
+        return buffer
+    
+    def _load_columns(self, columns: list) -> None:
+        n = len(columns[0])
+        if any(len(column) != n for column in columns):
+            raise ValueError(f'{type(self).__name__} columns must all have the same length')
+        capacity = max(self._initial_capacity, n)
+        for (name, dtype), column in zip(self._columns.items(), columns):
+            buffer = self._buffers[name] = np.empty(capacity, dtype=dtype)
+            buffer[:n] = column
+        self._count = n
+    
+    def _append_row(self, row: Tuple) -> None:
+        """Write one row, given in `_columns` order"""
+        i = self._count
+        buffers = self._buffers
+        if i == len(next(iter(buffers.values()))):
+            self._grow()
+        for buffer, value in zip(buffers.values(), row):
+            buffer[i] = value
+        self._count = i + 1
+    
+    def _grow(self) -> None:
+        for name, old in self._buffers.items():
+            new = np.empty(old.size * 2, dtype=old.dtype)
+            new[:self._count] = old[:self._count]
+            self._buffers[name] = new
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __eq__(self, other: Any) -> bool:
+        # Only the filled rows count; the rest of each buffer is uninitialised
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return (
+            type(self) is type(other)
+            and all(getattr(self, name) == getattr(other, name) for name in type(self).model_fields)
+            and all(np.array_equal(self._buffers[name][:self._count], other._buffers[name][:other._count])
+                    for name in self._columns)
+        )
+
+class InternedStrEnum(str, Enum):
+    """String enum whose values are interned, so value comparisons short-circuit on identity"""
+    def __new__(cls, value: str):
+        value = sys.intern(value)
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        return obj
+
+class NamedIntEnum(int, Enum):
+    """Int enum compared numerically internally, exchanged by lowercase name at the API boundary
+    
+    Fields accept the member, its value or its name (any case), serialize to the
+    lowercase name in JSON, and advertise those names in the JSON schema.
+    """
+    def __str__(self) -> str:
+        return self.name.lower()
+    
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+    
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(str, when_used='json'),
+        )
+    
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler) -> dict:
+        return {'type': 'string', 'enum': [str(member) for member in cls]}
+
+class SystemRole(InternedStrEnum):
     """System role types"""
     OPERATOR = "operator"
     TRADER = "trader"
@@ -9,7 +201,7 @@ class SystemRole(str, Enum):
     RISK_MANAGER = "risk_manager"
     EXECUTOR = "executor"
 
-class SystemStatus(str, Enum):
+class SystemStatus(InternedStrEnum):
     """System operational status"""
     STARTING = "starting"
     RUNNING = "running"
@@ -18,14 +210,14 @@ class SystemStatus(str, Enum):
     ERROR = "error"
     MAINTENANCE = "maintenance"
 
-class AgentStatus(str, Enum):
+class AgentStatus(InternedStrEnum):
     """Agent operational status"""
     ACTIVE = "active"
     INACTIVE = "inactive"
     ERROR = "error"
     INITIALIZING = "initializing"
 
-class CommandType(str, Enum):
+class CommandType(InternedStrEnum):
     """System command types"""
     START = "start"
     STOP = "stop"
@@ -35,7 +227,7 @@ class CommandType(str, Enum):
     UPDATE_CONFIG = "update_config"
     EMERGENCY_STOP = "emergency_stop"
 
-class SystemEventType(str, Enum):
+class SystemEventType(InternedStrEnum):
     """System event types"""
     INFO = "info"
     WARNING = "warning"
@@ -1,9 +1,19 @@
-from datetime import datetime
-from enum import Enum
+import time
+from dataclasses import dataclass, field
+from bisect import bisect_right
+from datetime import datetime, timezone
+from itertools import accumulate
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
-class OrderType(str, Enum):
+from mts.models.base import ArrayModel, FloatArray, InternedStrEnum
+
+def _now() -> datetime:
+    """Current UTC time as an aware datetime (replaces deprecated datetime.utcnow)"""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc)
+
+class OrderType(InternedStrEnum):
     MARKET = "market"
     LIMIT = "limit"
     STOP_MARKET = "stop_market"
@@ -11,11 +21,11 @@ class OrderType(str, Enum):
     TAKE_PROFIT = "take_profit"
     TRAILING_STOP = "trailing_stop"
 
-class OrderSide(str, Enum):
+class OrderSide(InternedStrEnum):
     BUY = "buy"
     SELL = "sell"
 
-class OrderStatus(str, Enum):
+class OrderStatus(InternedStrEnum):
     PENDING = "pending"
     OPEN = "open"
     FILLED = "filled"
@@ -24,15 +34,16 @@ class OrderStatus(str, Enum):
     REJECTED = "rejected"
     EXPIRED = "expired"
 
-class ExecutionQuality(BaseModel):
+@dataclass(slots=True)
+class ExecutionQuality:
     """Metrics for execution quality"""
-    slippage: float = Field(description="Price slippage in basis points")
-    fill_time: float = Field(description="Time to fill in seconds")
-    price_impact: float = Field(description="Market impact in basis points")
-    filled_quantity: float = Field(description="Amount filled")
-    remaining_quantity: float = Field(description="Amount remaining")
-    average_fill_price: float = Field(description="Average fill price")
-    fees_paid: float = Field(description="Total fees paid")
+    slippage: float  # Price slippage in basis points
+    fill_time: float  # Time to fill in seconds
+    price_impact: float  # Market impact in basis points
+    filled_quantity: float  # Amount filled
+    remaining_quantity: float  # Amount remaining
+    average_fill_price: float  # Average fill price
+    fees_paid: float  # Total fees paid
 
 class OrderRequest(BaseModel):
     """Request to execute an order"""
@@ -49,22 +60,23 @@ class OrderRequest(BaseModel):
     
     @field_validator('price')
     def validate_price(cls, v, values):
-        if values['order_type'] in [OrderType.LIMIT, OrderType.STOP_LIMIT] and v is None:
+        if values.data.get('order_type') in [OrderType.LIMIT, OrderType.STOP_LIMIT] and v is None:
             raise ValueError("Limit orders require a price")
         return v
     
     @field_validator('stop_price')
     def validate_stop_price(cls, v, values):
-        if values['order_type'] in [OrderType.STOP_MARKET, OrderType.STOP_LIMIT] and v is None:
+        if values.data.get('order_type') in [OrderType.STOP_MARKET, OrderType.STOP_LIMIT] and v is None:
             raise ValueError("Stop orders require a stop price")
         return v
 
-class OrderResult(BaseModel):
+@dataclass(slots=True)
+class OrderResult:
     """Result of order execution"""
     request: OrderRequest
     order_id: str
     status: OrderStatus
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_now)
     filled_quantity: float = 0
     remaining_quantity: float = 0
     average_fill_price: Optional[float] = None
@@ -72,7 +84,8 @@ class OrderResult(BaseModel):
     execution_quality: Optional[ExecutionQuality] = None
     error_message: Optional[str] = None
 
-class PositionManagement(BaseModel):
+@dataclass(slots=True)
+class PositionManagement:
     """Position management parameters"""
     asset: str
     current_size: float
@@ -82,16 +95,17 @@ class PositionManagement(BaseModel):
     stop_loss: Optional[float]
     take_profit: Optional[float]
     trailing_stop: Optional[float]
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
+    last_updated: datetime = field(default_factory=_now)
 
-class ExecutionStrategy(str, Enum):
+class ExecutionStrategy(InternedStrEnum):
     AGGRESSIVE = "aggressive"  # Cross the spread for immediate fill
     PASSIVE = "passive"       # Post limit orders
     ADAPTIVE = "adaptive"     # Adjust based on market conditions
     TWAP = "twap"            # Time-weighted average price
     VWAP = "vwap"            # Volume-weighted average price
 
-class ExecutionMetrics(BaseModel):
+@dataclass(slots=True)
+class ExecutionMetrics:
     """Execution performance metrics"""
     total_filled: float = 0
     total_fees: float = 0
@@ -100,22 +114,47 @@ class ExecutionMetrics(BaseModel):
     success_rate: float = 0  # successful orders/total orders
     average_fill_time: float = 0
     cost_savings: float = 0  # vs. market impact
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_now)
 
-class LiquidityAnalysis(BaseModel):
+class LiquidityAnalysis(ArrayModel):
     """Analysis of available liquidity"""
     asset: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    bid_liquidity: Dict[float, float]  # price -> quantity
-    ask_liquidity: Dict[float, float]
+    timestamp: datetime = Field(default_factory=_now)
+    # Book sides stored as paired float64 arrays: prices[i] has quantities[i] available
+    bid_prices: FloatArray
+    bid_quantities: FloatArray
+    ask_prices: FloatArray
+    ask_quantities: FloatArray
     spread: float
     depth_impact: Dict[float, float]  # size -> expected price impact
     recent_trades: List[Dict[str, float]]  # recent trade sizes and prices
     
+    # depth_impact sorted by size, with impacts as a running maximum so they can be bisected
+    _sizes_sorted: List[float] = PrivateAttr(default_factory=list)
+    _impacts_sorted: List[float] = PrivateAttr(default_factory=list)
+    
+    @model_validator(mode='before')
+    def from_liquidity_maps(cls, data):
+        """Accept the legacy `bid_liquidity`/`ask_liquidity` price -> quantity dicts"""
+        if isinstance(data, dict):
+            data = dict(data)
+            for side in ('bid', 'ask'):
+                liquidity = data.pop(f'{side}_liquidity', None)
+                if liquidity is not None:
+                    data[f'{side}_prices'] = np.fromiter(liquidity.keys(), dtype=np.float64, count=len(liquidity))
+                    data[f'{side}_quantities'] = np.fromiter(liquidity.values(), dtype=np.float64, count=len(liquidity))
+        return data
+    
+    def model_post_init(self, __context) -> None:
+        super().model_post_init(__context)
+        self._sizes_sorted = sorted(self.depth_impact)
+        self._impacts_sorted = list(accumulate((self.depth_impact[s] for s in self._sizes_sorted), max))
+    
     def get_optimal_size(self, side: OrderSide, max_impact: float) -> float:
         """Calculate optimal order size given max acceptable price impact"""
-        liquidity = self.ask_liquidity if side == OrderSide.BUY else self.bid_liquidity
-        for size, impact in self.depth_impact.items():
-            if impact > max_impact:
-                return size - 1  # Return size just below impact threshold
-        return max(liquidity.values())  # Return max available if impact acceptable
\ No newline at end of file
+        quantities = self.ask_quantities if side == OrderSide.BUY else self.bid_quantities
+        # First size bucket whose impact exceeds the threshold
+        idx = bisect_right(self._impacts_sorted, max_impact)
+        if idx < len(self._sizes_sorted):
+            return self._sizes_sorted[idx] - 1  # Return size just below impact threshold
+        return float(quantities.max())  # Return max available if impact acceptable
@@ -1,7 +1,23 @@
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from enum import Enum
+from functools import cached_property
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, Field, field_validator, ConfigDict 
+import numpy as np
+from pydantic import AliasChoices, BaseModel, Field, PrivateAttr, computed_field, field_validator, model_validator, ConfigDict, TypeAdapter
+from pydantic_core import from_json
+
+from mts.models.base import EPOCH, ArrayModel, ColumnBuffer, FloatArray, IntArray, to_epoch_ns
+
+def _hl_time_to_ns(time_ms):
+    """Convert a Hyperliquid epoch-millisecond time to epoch nanoseconds"""
+    return int(time_ms) * 1_000_000 if time_ms is not None else None
+
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+# Hyperliquid trade sides: B(id) -> buy, A(sk) -> sell; TradesBatch stores them as +1/-1
+_HL_SIDES = {'B': 'buy', 'A': 'sell'}
+_HL_SIDE_SIGNS = {'B': 1, 'A': -1}
 
 class TimeFrame(str, Enum):
     M1 = "1m"
@@ -22,6 +38,8 @@ class MarketDataType(str, Enum):
 
 class Candle(BaseModel):
     """Price candlestick data"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     timestamp: datetime
     open: float
     high: float
@@ -31,80 +49,161 @@ class Candle(BaseModel):
     trades: int
     timeframe: TimeFrame
     
-    @property
+    @cached_property
     def range(self) -> float:
         """Calculate candle range"""
         return self.high - self.low
     
-    @property
+    @cached_property
     def body(self) -> float:
         """Calculate candle body size"""
         return abs(self.close - self.open)
     
-    @property
+    @cached_property
     def is_bullish(self) -> bool:
         """Check if candle is bullish"""
         return self.close > self.open
 
-class OrderBookLevel(BaseModel):
+@dataclass(slots=True, frozen=True)
+class OrderBookLevel:
     """Single level in the order book"""
     price: float
     quantity: float
-    orders: int = Field(default=1)
+    orders: int = 1
 
-class OrderBook(BaseModel):
-    """Full order book snapshot"""
+class OrderBook(ArrayModel):
+    """Full order book snapshot, stored as parallel price/quantity arrays per side
+    
+    Snapshots are immutable; book updates build a new OrderBook, so derived values
+    such as spread and mid_price are cached on first access.
+    """
+    model_config = ConfigDict(frozen=True)
+    
     asset: str
     timestamp: datetime
-    bids: List[OrderBookLevel]
-    asks: List[OrderBookLevel]
+    bid_prices: FloatArray  # best (highest) bid first
+    bid_qtys: FloatArray
+    bid_orders: IntArray
+    ask_prices: FloatArray  # best (lowest) ask first
+    ask_qtys: FloatArray
+    ask_orders: IntArray
+    
+    @model_validator(mode='before')
+    def from_levels(cls, data):
+        """Accept the legacy `bids`/`asks` lists of OrderBookLevel (or dicts)"""
+        if isinstance(data, dict):
+            data = dict(data)
+            for side in ('bid', 'ask'):
+                levels = data.pop(f'{side}s', None)
+                if levels is not None:
+                    levels = [
+                        level if isinstance(level, OrderBookLevel) else OrderBookLevel(**level)
+                        for level in levels
+                    ]
+                    data[f'{side}_prices'] = [level.price for level in levels]
+                    data[f'{side}_qtys'] = [level.quantity for level in levels]
+                    data[f'{side}_orders'] = [level.orders for level in levels]
+                elif f'{side}_orders' not in data and f'{side}_qtys' in data:
+                    data[f'{side}_orders'] = np.ones(len(data[f'{side}_qtys']), dtype=np.int64)
+        return data
+    
+    @property
+    def bids(self) -> List[OrderBookLevel]:
+        """Bid levels as OrderBookLevel objects (built on access)"""
+        return [
+            OrderBookLevel(price=p, quantity=q, orders=o)
+            for p, q, o in zip(self.bid_prices.tolist(), self.bid_qtys.tolist(), self.bid_orders.tolist())
+        ]
     
     @property
+    def asks(self) -> List[OrderBookLevel]:
+        """Ask levels as OrderBookLevel objects (built on access)"""
+        return [
+            OrderBookLevel(price=p, quantity=q, orders=o)
+            for p, q, o in zip(self.ask_prices.tolist(), self.ask_qtys.tolist(), self.ask_orders.tolist())
+        ]
+    
+    @cached_property
     def spread(self) -> float:
         """Calculate bid-ask spread"""
-        return self.asks[0].price - self.bids[0].price if self.bids and self.asks else 0
+        return float(self.ask_prices[0] - self.bid_prices[0]) if self.bid_prices.size and self.ask_prices.size else 0
     
-    @property
+    @cached_property
     def mid_price(self) -> float:
         """Calculate mid price"""
-        return (self.asks[0].price + self.bids[0].price) / 2 if self.bids and self.asks else 0
+        return float(self.ask_prices[0] + self.bid_prices[0]) / 2 if self.bid_prices.size and self.ask_prices.size else 0
     
     def imbalance(self, depth: int = 10) -> float:
         """Calculate order book imbalance at given depth"""
-        bid_vol = sum(level.quantity for level in self.bids[:depth])
-        ask_vol = sum(level.quantity for level in self.asks[:depth])
+        bid_vol = float(np.add.reduce(self.bid_qtys[:depth]))
+        ask_vol = float(np.add.reduce(self.ask_qtys[:depth]))
         total_vol = bid_vol + ask_vol
         return (bid_vol - ask_vol) / total_vol if total_vol > 0 else 0
 
 class Trade(BaseModel):
-    """Individual trade data"""
+    """Individual trade data
+    
+    Fields also validate from Hyperliquid's raw keys (px, sz, side 'B'/'A',
+    liquidatedUser), so a raw trade is parsed in a single pydantic-core pass. The
+    trade time is kept as integer epoch nanoseconds; `timestamp` is derived on access.
+    """
     asset: str
-    timestamp: datetime
-    price: float
-    quantity: float
+    ts_ns: int  # epoch nanoseconds
+    price: float = Field(validation_alias=AliasChoices('price', 'px'))
+    quantity: float = Field(validation_alias=AliasChoices('quantity', 'sz'))
     side: str  # 'buy' or 'sell'
-    liquidation: bool = Field(default=False)
+    liquidation: bool = Field(default=False, validation_alias=AliasChoices('liquidation', 'liquidatedUser'))
     maker: bool = Field(default=False)
     fee: Optional[float] = None
     
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
-        validate_assignment=True
+        frozen=True,
+        extra='ignore'
     )
 
+    @model_validator(mode='before')
+    def from_timestamp(cls, data):
+        """Accept the legacy `timestamp` datetime in place of `ts_ns`"""
+        if isinstance(data, dict) and 'ts_ns' not in data and data.get('timestamp') is not None:
+            data = dict(data)
+            data['ts_ns'] = to_epoch_ns(_DATETIME_ADAPTER.validate_python(data.pop('timestamp')))
+        return data
+
+    @computed_field
+    @cached_property
+    def timestamp(self) -> datetime:
+        """Trade time as an aware UTC datetime"""
+        return EPOCH + timedelta(microseconds=self.ts_ns // 1000)
+
+    @classmethod
+    def from_hyperliquid(cls, data: Union[dict, bytes, str], asset: str) -> 'Trade':
+        """Create Trade from Hyperliquid data (a decoded dict or the raw JSON payload)"""
+        if not isinstance(data, dict):
+            data = from_json(data)
+        return cls.model_validate({'fee': 0.0, **data, 'asset': asset, 'ts_ns': _hl_time_to_ns(data.get('time'))})
+
     @classmethod
-    def from_hyperliquid(cls, data: dict, asset: str) -> 'Trade':
-        """Create Trade from Hyperliquid data"""
-        return cls(
-            asset=asset,
-            timestamp=datetime.fromtimestamp(data.get('time', 0) / 1000, timezone.utc),
-            price=float(data.get('px', 0)),
-            quantity=float(data.get('sz', 0)),
-            side='buy' if data.get('side') == 'B' else 'sell',
-            liquidation=bool(data.get('liquidatedUser', False)),
-            maker=bool(data.get('maker', False)),
-            fee=float(data.get('fee', 0))
-        )
+    def from_hyperliquid_batch(cls, data: Union[List[dict], bytes, str], asset: str) -> List['Trade']:
+        """Create Trades from a burst of Hyperliquid trades, validated in one pydantic-core call"""
+        if not isinstance(data, list):
+            data = from_json(data)
+        prepared = [{'fee': 0.0, **d, 'asset': asset, 'ts_ns': _hl_time_to_ns(d.get('time'))} for d in data]
+        return _TRADES_ADAPTER.validate_python(prepared)
+
+    @field_validator('side', mode='before')
+    def normalize_side(cls, v):
+        return _HL_SIDES.get(v, v)
+
+    @field_validator('liquidation', mode='before')
+    def normalize_liquidation(cls, v):
+        # Hyperliquid reports the liquidated user's address (or null) rather than a flag;
+        # anything else goes through normal bool parsing, so 'false' stays False
+        if v is None:
+            return False
+        if isinstance(v, str) and v.startswith('0x'):
+            return True
+        return v
 
     @field_validator('side')
     def validate_side(cls, v):
@@ -112,8 +211,12 @@ class Trade(BaseModel):
             raise ValueError('side must be either buy or sell')
         return v
 
+_TRADES_ADAPTER = TypeAdapter(List[Trade])
+
 class FundingRate(BaseModel):
     """Funding rate data"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     asset: str
     timestamp: datetime
     rate: float  # hourly rate
@@ -125,29 +228,68 @@ class FundingRate(BaseModel):
             raise ValueError('Funding rate exceeds normal range')
         return v
 
-class MarketDepth(BaseModel):
-    """Market depth analysis"""
+class MarketDepth(ArrayModel):
+    """Market depth analysis
+    
+    Each side is a pair of float64 arrays sorted from the best price outwards (asks
+    ascending, bids descending), with volumes cumulative from the best price.
+    """
     asset: str
     timestamp: datetime
-    bid_depth: Dict[float, float]  # price -> cumulative volume
-    ask_depth: Dict[float, float]
+    bid_prices: FloatArray
+    bid_vols: FloatArray  # cumulative volume at each bid price
+    ask_prices: FloatArray
+    ask_vols: FloatArray  # cumulative volume at each ask price
+    
+    _bid_search_keys: np.ndarray = PrivateAttr()  # -bid prices, ascending for searchsorted
+    _best_ask: float = PrivateAttr()
+    _worst_ask: float = PrivateAttr()
+    _worst_bid: float = PrivateAttr()
+    
+    @model_validator(mode='before')
+    def from_depth_maps(cls, data):
+        """Accept the legacy `bid_depth`/`ask_depth` price -> cumulative volume dicts"""
+        if isinstance(data, dict):
+            data = dict(data)
+            for side in ('bid', 'ask'):
+                depth = data.pop(f'{side}_depth', None)
+                if depth is not None:
+                    data[f'{side}_prices'] = np.fromiter(depth.keys(), dtype=np.float64, count=len(depth))
+                    data[f'{side}_vols'] = np.fromiter(depth.values(), dtype=np.float64, count=len(depth))
+        return data
+    
+    def model_post_init(self, __context) -> None:
+        super().model_post_init(__context)
+        order = np.argsort(self.ask_prices, kind='stable')
+        self.ask_prices, self.ask_vols = self.ask_prices[order], self.ask_vols[order]
+        order = np.argsort(-self.bid_prices, kind='stable')
+        self.bid_prices, self.bid_vols = self.bid_prices[order], self.bid_vols[order]
+        self._bid_search_keys = -self.bid_prices
+        
+        self._best_ask = float(self.ask_prices[0]) if self.ask_prices.size else 0.0
+        self._worst_ask = float(self.ask_prices[-1]) if self.ask_prices.size else 0.0
+        self._worst_bid = float(self.bid_prices[-1]) if self.bid_prices.size else 0.0
     
     def impact_price(self, size: float, side: str) -> float:
         """Calculate expected price after market impact"""
-        depth = self.ask_depth if side == 'buy' else self.bid_depth
-        for price, cum_vol in depth.items():
-            if cum_vol >= size:
-                return price
-        return list(depth.keys())[-1]  # Return worst price if size > liquidity
+        prices, cum = (self.ask_prices, self.ask_vols) if side == 'buy' else (self.bid_prices, self.bid_vols)
+        idx = int(np.searchsorted(cum, size))  # first level whose cumulative volume covers size
+        if idx < prices.size:
+            return float(prices[idx])
+        return self._worst_ask if side == 'buy' else self._worst_bid  # Return worst price if size > liquidity
     
     def liquidity_score(self, price_range: float = 0.01) -> float:
         """Calculate liquidity score within price range"""
-        mid_price = min(self.ask_depth.keys())  # First ask price
+        mid_price = self._best_ask  # First ask price
         upper_bound = mid_price * (1 + price_range)
         lower_bound = mid_price * (1 - price_range)
         
-        bid_liquidity = sum(vol for p, vol in self.bid_depth.items() if p >= lower_bound)
-        ask_liquidity = sum(vol for p, vol in self.ask_depth.items() if p <= upper_bound)
+        # Depth values are already prefix sums from the best price, so the liquidity in
+        # range is one lookup: the cumulative value at the last level inside it
+        i = int(np.searchsorted(self.ask_prices, upper_bound, side='right'))
+        ask_liquidity = float(self.ask_vols[i - 1]) if i else 0.0
+        j = int(np.searchsorted(self._bid_search_keys, -lower_bound, side='right'))
+        bid_liquidity = float(self.bid_vols[j - 1]) if j else 0.0
         
         return (bid_liquidity + ask_liquidity) / 2
 
@@ -166,13 +308,15 @@ class IndexPrice(BaseModel):
 
 class MarkPrice(BaseModel):
     """Mark price data"""
+    model_config = ConfigDict(frozen=True)
+    
     asset: str
     timestamp: datetime
     price: float
     index_price: Optional[float] = None
     fair_price: Optional[float] = None
     
-    @property
+    @cached_property
     def premium(self) -> Optional[float]:
         """Calculate premium over index"""
         if self.index_price:
@@ -181,6 +325,8 @@ class MarkPrice(BaseModel):
 
 class LiquidationEvent(BaseModel):
     """Liquidation event data"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     asset: str
     timestamp: datetime
     price: float
@@ -219,6 +365,62 @@ class VolumeProfile(BaseModel):
     value_area_low: float
     value_area_volume: float = Field(description="Volume within value area")
 
+class TradesBatch(ColumnBuffer):
+    """Columnar buffer of trades for a single asset
+    
+    Raw trades are appended straight into the column buffers; Trade objects are only
+    built on demand by `to_trades`.
+    """
+    _columns = {
+        'prices': np.float64,
+        'qtys': np.float64,
+        'ts_ns': np.int64,  # epoch nanoseconds
+        'side': np.int8,  # +1 for buys, -1 for sells
+        'is_liq': np.bool_,
+    }
+    
+    asset: str
+    
+    def append(self, data: dict) -> None:
+        """Append one raw Hyperliquid trade (px, sz, time in ms, side 'B'/'A', liquidatedUser)"""
+        side = _HL_SIDE_SIGNS.get(data.get('side'))
+        if side is None:
+            # Same rule as Trade, which rejects unknown side codes
+            raise ValueError('side must be either buy or sell')
+        self._append_row((
+            float(data['px']),
+            float(data['sz']),
+            int(data['time']) * 1_000_000,
+            side,
+            bool(data.get('liquidatedUser')),
+        ))
+    
+    @property
+    def last_price(self) -> Optional[float]:
+        return float(self.prices[-1]) if self._count else None
+    
+    def vwap(self) -> Optional[float]:
+        """Volume-weighted average price of the buffered trades"""
+        volume = float(self.qtys.sum())
+        return float(np.dot(self.prices, self.qtys)) / volume if volume > 0 else None
+    
+    def to_trades(self) -> List[Trade]:
+        """Materialize the buffered trades as Trade objects"""
+        return [
+            Trade(
+                asset=self.asset,
+                ts_ns=ts,
+                price=price,
+                quantity=qty,
+                side='buy' if side > 0 else 'sell',
+                liquidation=liq
+            )
+            for price, qty, ts, side, liq in zip(
+                self.prices.tolist(), self.qtys.tolist(), self.ts_ns.tolist(),
+                self.side.tolist(), self.is_liq.tolist()
+            )
+        ]
+
 class MarketData(BaseModel):
     """Combined market data"""
     asset: str
@@ -226,6 +428,7 @@ class MarketData(BaseModel):
     candle: Optional[Candle] = None
     orderbook: Optional[OrderBook] = None
     trades: List[Trade] = Field(default_factory=list)
+    trades_batch: Optional[TradesBatch] = None  # columnar trades, fed directly from the trade stream
     funding: Optional[FundingRate] = None
     depth: Optional[MarketDepth] = None
     index: Optional[IndexPrice] = None
@@ -236,28 +439,31 @@ class MarketData(BaseModel):
 
     def get_price(self, price_type: str = 'mark') -> Optional[float]:
         """Get price by type"""
-        if price_type == 'mark' and self.mark:
-            return self.mark.price
-        elif price_type == 'index' and self.index:
-            return self.index.price
-        elif price_type == 'mid' and self.orderbook:
-            return self.orderbook.mid_price
-        elif price_type == 'last' and self.trades:
-            return self.trades[-1].price if self.trades else None
-        return None
+        getter = _PRICE_GETTERS.get(price_type)
+        return getter(self) if getter is not None else None
 
     def get_data_by_type(self, data_type: MarketDataType) -> Union[BaseModel, List[BaseModel], None]:
         """Get specific type of market data"""
-        if data_type == MarketDataType.TRADE:
-            return self.trades
-        elif data_type == MarketDataType.FUNDING:
-            return self.funding
-        elif data_type == MarketDataType.LIQUIDATION:
-            return self.liquidations
-        elif data_type == MarketDataType.ORDERBOOK:
-            return self.orderbook
-        elif data_type == MarketDataType.INDEX:
-            return self.index
-        elif data_type == MarketDataType.MARK:
-            return self.mark
-        return None
\ No newline at end of file
+        attr = _DATA_TYPE_ATTRS.get(data_type)
+        return getattr(self, attr) if attr is not None else None
+
+def _last_trade_price(data: MarketData) -> Optional[float]:
+    if data.trades_batch is not None and len(data.trades_batch):
+        return data.trades_batch.last_price
+    return data.trades[-1].price if data.trades else None
+
+# Dispatch tables for MarketData.get_price / get_data_by_type
+_PRICE_GETTERS = {
+    'mark': lambda data: data.mark.price if data.mark else None,
+    'index': lambda data: data.index.price if data.index else None,
+    'mid': lambda data: data.orderbook.mid_price if data.orderbook else None,
+    'last': _last_trade_price,
+}
+_DATA_TYPE_ATTRS = {
+    MarketDataType.TRADE: 'trades',
+    MarketDataType.FUNDING: 'funding',
+    MarketDataType.LIQUIDATION: 'liquidations',
+    MarketDataType.ORDERBOOK: 'orderbook',
+    MarketDataType.INDEX: 'index',
+    MarketDataType.MARK: 'mark',
+}
@@ -3,6 +3,8 @@ from enum import Enum
 from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
+from mts.models.base import NamedIntEnum
+
 class MarketRegime(str, Enum):
     TRENDING_UP = "trending_up"
     TRENDING_DOWN = "trending_down"
@@ -11,11 +13,12 @@ class MarketRegime(str, Enum):
     ACCUMULATING = "accumulating"
     DISTRIBUTING = "distributing"
 
-class SignalStrength(str, Enum):
-    WEAK = "weak"
-    MODERATE = "moderate"
-    STRONG = "strong"
-    VERY_STRONG = "very_strong"
+class SignalStrength(NamedIntEnum):
+    """Signal strengths ordered by conviction; compared as ints internally, named at the API boundary"""
+    WEAK = 0
+    MODERATE = 1
+    STRONG = 2
+    VERY_STRONG = 3
 
 class PatternType(str, Enum):
     TECHNICAL = "technical"
@@ -0,0 +1,48 @@
+"""Structured responses returned by the ADK agents
+
+Only the fields the orchestrator branches on are typed; the rest are passed
+through as the agent wrote them, so loosely formatted LLM output (e.g. a
+confidence of "85%") doesn't abort the trading cycle.
+"""
+from typing import Any, Literal
+from pydantic import BaseModel, ConfigDict, field_validator
+
+class OracleResponse(BaseModel):
+    """Market analysis from the Oracle"""
+    model_config = ConfigDict(extra='allow')
+
+    prediction: Any = None
+    summary: str = ''
+    confidence: Any = None
+
+class NeoResponse(BaseModel):
+    """Trading signal from Neo"""
+    model_config = ConfigDict(extra='allow')
+
+    signal: Literal['BUY', 'SELL', 'HOLD'] = 'HOLD'
+    confidence: Any = None
+    reasoning: Any = None
+
+    @field_validator('signal', mode='before')
+    def normalize_signal(cls, v):
+        return v.upper() if isinstance(v, str) else v
+
+class MorpheusResponse(BaseModel):
+    """Risk assessment and go/no-go decision from Morpheus"""
+    model_config = ConfigDict(extra='allow')
+
+    risk_assessment: Any = None
+    position_size: Any = None
+    decision: str = ''
+
+    @field_validator('decision', mode='before')
+    def normalize_decision(cls, v):
+        return v.upper() if isinstance(v, str) else v
+
+class TrinityResponse(BaseModel):
+    """Execution report from Trinity"""
+    model_config = ConfigDict(extra='allow')
+
+    status: Any = None
+    order_id: Any = None
+    details: Any = None
@@ -1,13 +1,16 @@
 from datetime import datetime
-from enum import Enum
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field, validator
+import numpy as np
+from pydantic import BaseModel, Field, field_validator, model_validator
 
-class RiskLevel(str, Enum):
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    EXTREME = "extreme"
+from mts.models.base import ColumnBuffer, NamedIntEnum, to_epoch_ns
+
+class RiskLevel(NamedIntEnum):
+    """Risk levels ordered by severity, so they compare (and max()) numerically"""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    EXTREME = 3
 
 class VolatilityWindow(BaseModel):
     """Volatility analysis over a specific time window"""
@@ -16,6 +19,29 @@ class VolatilityWindow(BaseModel):
     timestamp: datetime = Field(description="When this volatility was calculated")
     samples: int = Field(description="Number of price samples used")
 
+class VolSeries(ColumnBuffer):
+    """Volatility windows for one timeframe, stored column-wise"""
+    _columns = {
+        'window_size': np.int64,
+        'volatility': np.float64,
+        'ts_ns': np.int64,  # calculation times as epoch nanoseconds
+        'samples': np.int64,
+    }
+    _initial_capacity = 32
+    
+    @classmethod
+    def from_windows(cls, windows: List[VolatilityWindow]) -> 'VolSeries':
+        series = cls()
+        for window in windows:
+            series.append(window)
+        return series
+    
+    def append(self, window: VolatilityWindow) -> None:
+        self._append_row((window.window_size, window.volatility, to_epoch_ns(window.timestamp), window.samples))
+    
+    def mean_volatility(self) -> Optional[float]:
+        return float(self.volatility.mean()) if self._count else None
+
 class PositionRisk(BaseModel):
     """Risk assessment for a specific position"""
     asset: str = Field(description="Asset being traded (e.g. 'HYPE')")
@@ -28,15 +54,14 @@ class PositionRisk(BaseModel):
     risk_level: RiskLevel = Field(description="Assessed risk level")
     max_drawdown: float = Field(description="Maximum drawdown for this position")
     
-    @validator('risk_level')
-    def assess_risk_level(cls, v, values):
+    @model_validator(mode='after')
+    def assess_risk_level(self):
         """Validate and potentially adjust risk level based on position metrics"""
-        if 'leverage' in values and 'max_drawdown' in values:
-            if values['leverage'] > 5 or values['max_drawdown'] > 0.1:
-                return RiskLevel.EXTREME
-            elif values['leverage'] > 3 or values['max_drawdown'] > 0.05:
-                return RiskLevel.HIGH
-        return v
+        if self.leverage > 5 or self.max_drawdown > 0.1:
+            self.risk_level = RiskLevel.EXTREME
+        elif self.leverage > 3 or self.max_drawdown > 0.05:
+            self.risk_level = RiskLevel.HIGH
+        return self
 
 class RiskMetrics(BaseModel):
     """Comprehensive risk metrics for the portfolio"""
@@ -47,16 +72,30 @@ class RiskMetrics(BaseModel):
     margin_ratio: float = Field(description="Used margin / Total equity")
     daily_pnl: float = Field(description="Profit/loss for the day")
     positions: Dict[str, PositionRisk] = Field(description="Risk metrics per position")
-    volatility_windows: Dict[str, List[VolatilityWindow]] = Field(
+    volatility_windows: Dict[str, VolSeries] = Field(
         description="Volatility analysis for different timeframes"
     )
     
+    @field_validator('volatility_windows', mode='before')
+    def windows_to_series(cls, v):
+        """Accept the legacy per-timeframe lists of VolatilityWindow (or dicts)
+        
+        Serialized VolSeries columns pass through and are rebuilt by VolSeries itself.
+        """
+        if isinstance(v, dict):
+            v = {
+                timeframe: VolSeries.from_windows([VolatilityWindow.model_validate(w) for w in windows])
+                if isinstance(windows, list) else windows
+                for timeframe, windows in v.items()
+            }
+        return v
+    
     @property
     def highest_risk_level(self) -> RiskLevel:
         """Get the highest risk level across all positions"""
-        if not self.positions:
-            return RiskLevel.LOW
-        return max(pos.risk_level for pos in self.positions.values())
+        # Computed on each access: positions is a mutable dict, so a cached maximum
+        # could go stale, and RiskLevel's int ordering makes max() correct
+        return max((pos.risk_level for pos in self.positions.values()), default=RiskLevel.LOW)
     
     @property
     def is_margin_safe(self) -> bool:
@@ -73,7 +112,7 @@ class PositionSizing(BaseModel):
     risk_reward_ratio: float = Field(description="Risk/reward ratio for the trade")
     confidence: float = Field(ge=0, le=1, description="Confidence in the recommendation")
     
-    @validator('risk_reward_ratio')
+    @field_validator('risk_reward_ratio')
     def validate_risk_reward(cls, v):
         """Validate risk/reward ratio is reasonable"""
         if v < 1.5:
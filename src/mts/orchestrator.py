@@ -1,15 +1,33 @@
 import asyncio
-import json
+from typing import Final
 from loguru import logger
+from pydantic import ValidationError
 
 from mts.core.config import MTSConfig
 from mts.adk_tools.trading_tools import TradingTools
 from mts.adk_tools.risk_tools import RiskTools
+from mts.models.responses import OracleResponse, NeoResponse, MorpheusResponse, TrinityResponse
 from ..adk_agents.oracle_agent import create_oracle_agent
 from ..adk_agents.neo_agent import create_neo_agent
 from ..adk_agents.morpheus_agent import create_morpheus_agent
 from ..adk_agents.trinity_agent import create_trinity_agent
 
+# Agent prompts, filled in with only the fields each agent needs
+_ORACLE_PROMPT: Final[str] = "Analyze the current market conditions for our target asset, {asset}."
+_NEO_PROMPT: Final[str] = (
+    "Market analysis is as follows: {summary}. Identify patterns and generate a clear, "
+    "actionable trading signal (BUY, SELL, or HOLD) with a confidence score."
+)
+_MORPHEUS_PROMPT: Final[str] = (
+    "Current portfolio equity is ${equity:.2f}. "
+    "Given the trading signal: {signal} (confidence: {confidence}), assess the risk using a {risk_pct}% risk parameter. "
+    "Current position for {asset}: {position}."
+)
+_TRINITY_PROMPT: Final[str] = (
+    "Execute the approved trade: {signal} {asset}, position size {position_size}. "
+    "Risk assessment: {risk_assessment}."
+)
+
 class MTSOrchestrator:
     """
     The central orchestrator for the MTS trading system, managing the flow
@@ -38,62 +56,76 @@ class MTSOrchestrator:
         logger.info("Starting new trading cycle...")
         target_asset = self.config.trading.default_asset
 
+        # Prefetch the current position while Oracle and Neo run; it is only awaited
+        # if Neo produces a tradeable signal
+        position_task = asyncio.create_task(self.trading_tools.get_position(target_asset))
+
         try:
             # 1. Oracle: Analyze market conditions
             logger.info(f"Oracle: Analyzing market conditions for {target_asset}...")
-            oracle_raw_response = await self.oracle_agent.run(
-                f"Analyze the current market conditions for our target asset, {target_asset}."
-            )
-            oracle_response = json.loads(oracle_raw_response)
+            oracle_raw_response = await self.oracle_agent.run(_ORACLE_PROMPT.format(asset=target_asset))
+            oracle_response = OracleResponse.model_validate_json(oracle_raw_response)
             logger.info(f"Oracle Response: {oracle_response}")
 
             # 2. Neo: Identify patterns and generate trading signal
             logger.info("Neo: Identifying patterns and generating trading signal...")
-            neo_raw_response = await self.neo_agent.run(
-                f"Market analysis is as follows: {oracle_response.get('summary', '')}. Identify patterns and generate a clear, actionable trading signal (BUY, SELL, or HOLD) with a confidence score."
-            )
-            neo_response = json.loads(neo_raw_response)
+            neo_raw_response = await self.neo_agent.run(_NEO_PROMPT.format(summary=oracle_response.summary))
+            neo_response = NeoResponse.model_validate_json(neo_raw_response)
             logger.info(f"Neo Response: {neo_response}")
 
             # 3. Decision: If Neo indicates a BUY or SELL signal
-            signal = neo_response.get('signal', '').upper()
+            signal = neo_response.signal
             if signal in ["BUY", "SELL"]:
                 logger.info("Trading signal detected. Proceeding to Morpheus for risk assessment.")
 
                 # Get current portfolio status for Morpheus
-                current_position = await self.trading_tools.get_position(target_asset)
+                current_position = await position_task
                 total_equity = current_position.get('unrealized_pnl', 0) + current_position.get('realized_pnl', 0) if current_position else 10000 # Placeholder if no position
                 risk_percentage = self.config.risk.position_size_pct
 
-                morpheus_prompt = (
-                    f"Current portfolio equity is ${total_equity:.2f}. "
-                    f"Given the trading signal: {neo_response}, assess the risk using a {risk_percentage * 100}% risk parameter. "
-                    f"Current position for {target_asset}: {current_position}."
+                morpheus_prompt = _MORPHEUS_PROMPT.format(
+                    equity=total_equity,
+                    signal=signal,
+                    confidence=neo_response.confidence,
+                    risk_pct=risk_percentage * 100,
+                    asset=target_asset,
+                    position=current_position,
                 )
 
                 # 4. Morpheus: Assess risk and determine go/no-go decision
                 logger.info("Morpheus: Assessing risk and determining go/no-go decision...")
                 morpheus_raw_response = await self.morpheus_agent.run(morpheus_prompt)
-                morpheus_response = json.loads(morpheus_raw_response)
+                morpheus_response = MorpheusResponse.model_validate_json(morpheus_raw_response)
                 logger.info(f"Morpheus Response: {morpheus_response}")
 
                 # 5. Decision: If Morpheus gives a "go"
-                if morpheus_response.get('decision', '').upper() == "GO":
+                if morpheus_response.decision == "GO":
                     logger.info("Risk assessment approved. Proceeding to Trinity for trade execution.")
 
                     # 6. Trinity: Execute the approved trade
                     logger.info("Trinity: Executing approved trade...")
-                    trinity_raw_response = await self.trinity_agent.run(
-                        f"Execute the approved trade: {morpheus_response}."
-                    )
-                    trinity_response = json.loads(trinity_raw_response)
+                    trinity_raw_response = await self.trinity_agent.run(_TRINITY_PROMPT.format(
+                        signal=signal,
+                        asset=target_asset,
+                        position_size=morpheus_response.position_size,
+                        risk_assessment=morpheus_response.risk_assessment,
+                    ))
+                    trinity_response = TrinityResponse.model_validate_json(trinity_raw_response)
                     logger.info(f"Trinity Response: {trinity_response}")
                 else:
                     logger.warning("Morpheus: Trade not approved due to risk assessment.")
             else:
                 logger.info("Neo: No clear BUY or SELL signal. Holding position.")
 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decoding error in agent response: {e}. Raw response: {e.doc}")
+        except ValidationError as e:
+            # Raised for both malformed JSON and responses that do not match the schema;
+            # e.title names the response model, i.e. which agent's reply failed
+            logger.error(f"Invalid agent response ({e.title}): {e}")
         except Exception as e:
-            logger.error(f"Error during trading cycle: {e}")
\ No newline at end of file
+            logger.error(f"Error during trading cycle: {e}")
+        finally:
+            # Don't leave an unneeded prefetch running, or its error unretrieved
+            if not position_task.done():
+                position_task.cancel()
+            elif not position_task.cancelled():
+                position_task.exception()
\ No newline at end of file
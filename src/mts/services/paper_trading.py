@@ -3,6 +3,15 @@ class PaperTradingService:
         pass
     async def execute_order(self, order):
         pass
+    async def execute_orders_batch(self, orders):
+        # One entry per order: its result, or the exception it raised
+        results = []
+        for order in orders:
+            try:
+                results.append(await self.execute_order(order))
+            except Exception as e:
+                results.append(e)
+        return results
     async def get_position(self, asset: str):
         pass
     async def get_order_status(self, order_id: str):
@@ -0,0 +1,87 @@
+import asyncio
+import builtins
+import importlib
+import sys
+import types
+
+import pytest
+from pydantic import SecretStr
+
+
+class FakeHyperliquidService:
+    def __init__(self, config):
+        self.init_calls = 0
+        self.fail_next = False
+
+    async def initialize(self):
+        self.init_calls += 1
+        await asyncio.sleep(0)
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("transient init failure")
+
+    async def get_market_info(self, asset):
+        return {"asset": asset}
+
+
+@pytest.fixture
+def trading_tools(monkeypatch):
+    """trading_tools with the ADK SDK stubbed out and fresh service caches"""
+    adk = types.SimpleNamespace(Tool=object, tool_method=lambda f: f)
+    monkeypatch.setitem(sys.modules, "google_adk", types.SimpleNamespace(**vars(adk)))
+    monkeypatch.setattr(builtins, "adk", adk, raising=False)
+    monkeypatch.delitem(sys.modules, "mts.adk_tools.trading_tools", raising=False)
+    module = importlib.import_module("mts.adk_tools.trading_tools")
+    monkeypatch.setattr(module, "HyperliquidService", FakeHyperliquidService)
+    return module
+
+
+def _config():
+    hyperliquid = types.SimpleNamespace(account_address="0xabc", is_testnet=True, secret_key=SecretStr("k"))
+    return types.SimpleNamespace(hyperliquid=hyperliquid)
+
+
+def test_failed_init_is_retried(trading_tools):
+    async def run():
+        tools = trading_tools.TradingTools(_config())
+        tools.hyperliquid_service.fail_next = True
+        with pytest.raises(RuntimeError, match="transient init failure"):
+            await tools.get_market_info("BTC")
+
+        other = trading_tools.TradingTools(_config())
+        assert await other.get_market_info("BTC") == {"asset": "BTC"}
+        assert await tools.get_market_info("BTC") == {"asset": "BTC"}
+        return tools.hyperliquid_service.init_calls
+
+    assert asyncio.run(run()) == 2
+
+
+def test_init_task_from_a_closed_loop_is_replaced(trading_tools):
+    async def build():
+        # The loop shuts down and cancels the init task before it is ever awaited
+        return trading_tools.TradingTools(_config())
+
+    tools = asyncio.run(build())
+
+    async def call():
+        return await tools.get_market_info("BTC")
+
+    assert asyncio.run(call()) == {"asset": "BTC"}
+    assert tools.hyperliquid_service.init_calls == 2
+
+
+def test_init_error_rejects_orders(trading_tools):
+    order = {"asset": "BTC", "side": "buy", "order_type": "market", "quantity": 1, "price": None, "stop_price": None}
+
+    async def run():
+        tools = trading_tools.TradingTools(_config())
+        tools.hyperliquid_service.fail_next = True
+        single = await tools.execute_order(order)
+        tools.hyperliquid_service.fail_next = True
+        batch = await tools.execute_orders([order, order])
+        return single, batch
+
+    single, batch = asyncio.run(run())
+    assert single.status == trading_tools.OrderStatus.REJECTED
+    assert [result.status for result in batch] == [trading_tools.OrderStatus.REJECTED] * 2
+    assert single.error_message == "transient init failure"
@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from mts.models.market import MarketData, OrderBook, Trade, TradesBatch
+
+
+def _batch(n: int) -> TradesBatch:
+    batch = TradesBatch(asset='BTC')
+    for i in range(n):
+        batch.append({
+            'px': 100 + i,
+            'sz': 0.5,
+            'time': 1_700_000_000_000 + i,
+            'side': 'B' if i % 2 else 'A',
+            'liquidatedUser': '0xabc' if i == 3 else None,
+        })
+    return batch
+
+
+def test_trades_batch_round_trip():
+    # 100 trades forces the buffers past their initial capacity
+    data = MarketData(asset='BTC', timestamp=datetime.now(timezone.utc), trades_batch=_batch(100))
+
+    from_python = MarketData.model_validate(data.model_dump())
+    from_json = MarketData.model_validate_json(data.model_dump_json())
+
+    for restored in (from_python, from_json):
+        assert restored == data
+        assert len(restored.trades_batch) == 100
+        assert restored.get_price('last') == 199.0
+        assert restored.trades_batch.to_trades() == data.trades_batch.to_trades()
+
+
+def test_trades_batch_count_is_not_an_input():
+    batch = TradesBatch(asset='BTC', count=5)
+    assert len(batch) == 0
+    assert batch.prices.size == 0
+    assert batch.last_price is None
+
+
+def test_orderbook_does_not_share_input_arrays():
+    bid_prices = np.array([100.0, 99.0])
+    book = OrderBook(
+        asset='BTC',
+        timestamp=datetime.now(timezone.utc),
+        bid_prices=bid_prices,
+        bid_qtys=[1.0, 2.0],
+        ask_prices=[102.0, 103.0],
+        ask_qtys=[1.0, 1.0],
+    )
+    digest = hash(book)
+    assert book.spread == 2.0
+
+    bid_prices[0] = 100.5
+    assert book.bid_prices[0] == 100.0
+    assert hash(book) == digest
+
+    with pytest.raises(ValueError):
+        book.bid_prices[0] = 101.0
+
+
+def test_trade_liquidation_flag():
+    raw = {'px': '100', 'sz': '1', 'time': 1_700_000_000_000, 'side': 'B'}
+    assert Trade.from_hyperliquid({**raw, 'liquidatedUser': '0xabc'}, 'BTC').liquidation is True
+    assert Trade.from_hyperliquid({**raw, 'liquidatedUser': None}, 'BTC').liquidation is False
+    assert Trade.from_hyperliquid(raw, 'BTC').liquidation is False
+    assert Trade(asset='BTC', ts_ns=0, price=1, quantity=1, side='buy', liquidation='false').liquidation is False
+
+
+def test_trade_accepts_legacy_timestamp():
+    timestamp = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+    trade = Trade(asset='BTC', timestamp=timestamp, price=1, quantity=1, side='sell')
+    assert trade.ts_ns == 1_704_112_200_000_000_000
+    assert trade.timestamp == timestamp
+    assert Trade.model_validate_json(trade.model_dump_json()) == trade
@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+
+from mts.models.risk import PositionRisk, RiskLevel, RiskMetrics
+
+
+def test_volatility_windows_round_trip():
+    windows = [
+        {'window_size': 5, 'volatility': 0.5, 'timestamp': datetime.now(timezone.utc), 'samples': 10}
+        for _ in range(40)
+    ]
+    metrics = RiskMetrics(
+        total_equity=1000,
+        used_margin=0,
+        available_margin=1000,
+        margin_ratio=0,
+        daily_pnl=0,
+        positions={},
+        volatility_windows={'1h': windows},
+    )
+
+    for restored in (
+        RiskMetrics.model_validate(metrics.model_dump()),
+        RiskMetrics.model_validate_json(metrics.model_dump_json()),
+    ):
+        assert restored == metrics
+        assert len(restored.volatility_windows['1h']) == 40
+        assert restored.volatility_windows['1h'].mean_volatility() == 0.5
+
+
+def _position(asset, risk_level):
+    return PositionRisk(
+        asset=asset,
+        position_size=1,
+        entry_price=100,
+        current_price=100,
+        leverage=1,
+        unrealized_pnl=0,
+        liquidation_price=None,
+        risk_level=risk_level,
+        max_drawdown=0,
+    )
+
+
+def _metrics(**positions):
+    return RiskMetrics(
+        total_equity=1000,
+        used_margin=0,
+        available_margin=1000,
+        margin_ratio=0,
+        daily_pnl=0,
+        positions=positions,
+        volatility_windows={},
+    )
+
+
+def test_risk_levels_order_by_severity():
+    assert RiskLevel.LOW < RiskLevel.MEDIUM < RiskLevel.HIGH < RiskLevel.EXTREME
+    # By name these would sort 'extreme' < 'high' < 'low'
+    assert _metrics(A=_position('A', 'low'), B=_position('B', 'high')).highest_risk_level == RiskLevel.HIGH
+
+
+def test_highest_risk_level_follows_position_changes():
+    metrics = _metrics(A=_position('A', 'low'))
+    assert metrics.highest_risk_level == RiskLevel.LOW
+
+    metrics.positions['C'] = _position('C', 'high')
+    assert metrics.highest_risk_level == RiskLevel.HIGH
+
+    metrics.positions['C'].risk_level = RiskLevel.EXTREME
+    assert metrics.highest_risk_level == RiskLevel.EXTREME
+
+    copy = metrics.model_copy(update={'positions': {'A': _position('A', 'low')}})
+    assert copy.highest_risk_level == RiskLevel.LOW
+    assert _metrics().highest_risk_level == RiskLevel.LOW